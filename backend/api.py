@@ -1,8 +1,35 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from solver import ProductionInput, SchedulingResult, solve_production_schedule
+from pydantic import TypeAdapter
+from solver import ProductionInput, SchedulingResult, initialize_solver, solve_production_schedule
+
+# Built once at import time: dumping through a prebuilt adapter goes straight
+# from the result model to JSON bytes in pydantic-core, skipping FastAPI's
+# jsonable_encoder pass and the re-validation against response_model.
+RESULT_ADAPTER = TypeAdapter(SchedulingResult)
+
+# Solves are CPU-bound, so they run on a process pool instead of the event
+# loop thread: concurrent requests solve in parallel and the loop stays
+# responsive. Each worker process owns its HiGHS instance and warm-start
+# cache (created by the initializer), so no cross-request locking is needed.
+executor: ProcessPoolExecutor
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global executor
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=initialize_solver,
+    )
+    yield
+    executor.shutdown()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,7 +42,8 @@ app.add_middleware(
 @app.post("/api/v1/schedule", response_model=SchedulingResult)
 async def create_schedule(input_data: ProductionInput):
     try:
-        result = solve_production_schedule(input_data)
-        return result
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(executor, solve_production_schedule, input_data)
+        return Response(content=RESULT_ADAPTER.dump_json(result), media_type="application/json")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))